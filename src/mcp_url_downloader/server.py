@@ -1,16 +1,19 @@
 import asyncio
+import contextlib
 import ipaddress
+import os
 import re
 import socket
 import urllib.parse
-import uuid
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 from typing import Annotated
 
 import httpx
 from dotenv import load_dotenv
-from mcp.server.fastmcp import FastMCP
-from pydantic import BaseModel, Field
+from mcp.server.fastmcp import Context, FastMCP
+from pydantic import BaseModel, Field, TypeAdapter
 
 load_dotenv()
 
@@ -18,9 +21,10 @@ load_dotenv()
 MAX_FILE_SIZE_MB = 500
 MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
 DEFAULT_DOWNLOAD_DIR = Path.home() / "Downloads" / "mcp_downloads"
-MAX_CONCURRENT_DOWNLOADS = 10
+MAX_CONCURRENT_DOWNLOADS = min(32, (os.cpu_count() or 1) * 4)  # I/O-bound, scale with cores
 MAX_URLS_PER_REQUEST = 100
 MAX_URL_LENGTH = 2048
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
 
 # Security: Allowed base directories for downloads
 ALLOWED_BASE_DIRS = [
@@ -29,43 +33,82 @@ ALLOWED_BASE_DIRS = [
     Path.home() / "Desktop",
     Path("/tmp"),
 ]
+# Resolved once at import; symlinked bases (e.g. /tmp on macOS) resolve to their targets
+_ALLOWED_ROOTS = tuple(d.resolve() for d in ALLOWED_BASE_DIRS)
+# String prefixes (as configured and as resolved) for the lexical pre-check
+_ALLOWED_ROOT_PREFIXES = tuple(
+    dict.fromkeys(
+        os.path.normpath(os.path.abspath(d)) for d in (*ALLOWED_BASE_DIRS, *_ALLOWED_ROOTS)
+    )
+)
 
 # Security: Blocked IP ranges for SSRF protection
 BLOCKED_IP_RANGES = [
+    ipaddress.ip_network("0.0.0.0/8"),  # "This" network
     ipaddress.ip_network("127.0.0.0/8"),  # Localhost
     ipaddress.ip_network("10.0.0.0/8"),  # Private
     ipaddress.ip_network("172.16.0.0/12"),  # Private
     ipaddress.ip_network("192.168.0.0/16"),  # Private
+    ipaddress.ip_network("100.64.0.0/10"),  # Carrier-grade NAT
     ipaddress.ip_network("169.254.0.0/16"),  # Link-local (AWS metadata)
+    ipaddress.ip_network("192.0.2.0/24"),  # Documentation (TEST-NET-1)
+    ipaddress.ip_network("198.51.100.0/24"),  # Documentation (TEST-NET-2)
+    ipaddress.ip_network("203.0.113.0/24"),  # Documentation (TEST-NET-3)
+    ipaddress.ip_network("198.18.0.0/15"),  # Benchmarking
+    ipaddress.ip_network("::/128"),  # IPv6 unspecified
     ipaddress.ip_network("::1/128"),  # IPv6 localhost
     ipaddress.ip_network("fc00::/7"),  # IPv6 private
     ipaddress.ip_network("fe80::/10"),  # IPv6 link-local
+    ipaddress.ip_network("2001:db8::/32"),  # IPv6 documentation
 ]
 
-# Security: Allowed MIME types
-ALLOWED_CONTENT_TYPES = {
-    "application/pdf",
-    "application/json",
-    "application/xml",
-    "application/zip",
-    "application/gzip",
-    "application/x-tar",
-    "application/octet-stream",
-    "text/plain",
-    "text/html",
-    "text/css",
-    "text/javascript",
-    "text/csv",
-    "image/jpeg",
-    "image/png",
-    "image/gif",
-    "image/svg+xml",
-    "image/webp",
-    "video/mp4",
-    "video/mpeg",
-    "audio/mpeg",
-    "audio/wav",
-}
+# Blocked ranges as inclusive (low, high) integer bounds, so checks are plain comparisons
+_IPV4_BLOCKED_RANGES = tuple(
+    (int(net.network_address), int(net.broadcast_address))
+    for net in BLOCKED_IP_RANGES
+    if net.version == 4
+)
+_IPV6_BLOCKED_RANGES = tuple(
+    (int(net.network_address), int(net.broadcast_address))
+    for net in BLOCKED_IP_RANGES
+    if net.version == 6
+)
+
+# Security: Allowed MIME types (lowercase, matched against the normalized header)
+ALLOWED_CONTENT_TYPES: frozenset[str] = frozenset(
+    {
+        "application/pdf",
+        "application/json",
+        "application/xml",
+        "application/zip",
+        "application/gzip",
+        "application/x-tar",
+        "application/octet-stream",
+        "text/plain",
+        "text/html",
+        "text/css",
+        "text/javascript",
+        "text/csv",
+        "image/jpeg",
+        "image/png",
+        "image/gif",
+        "image/svg+xml",
+        "image/webp",
+        "video/mp4",
+        "video/mpeg",
+        "audio/mpeg",
+        "audio/wav",
+    }
+)
+
+# Characters replaced with "_" in filenames: path separators, Windows-reserved and control chars
+_FILENAME_TRANSLATION = str.maketrans(
+    dict.fromkeys('<>:"/\\|?*' + "".join(map(chr, range(32))), "_")
+)
+
+# Patterns for scrubbing filesystem paths out of error messages
+_UNIX_PATH_RE = re.compile(r"/[\w/.-]+")
+_WINDOWS_PATH_RE = re.compile(r"[A-Z]:\\[\w\\.-]+")
 
 DESCRIPTION = """
 MCP server that enables AI assistants to download files from URLs to the local filesystem.
@@ -90,6 +133,15 @@ Example use cases:
 
 mcp = FastMCP("download-server", instructions=DESCRIPTION)
 
+# Bounded argument types shared by the tool signatures and the validators below
+TimeoutSeconds = Annotated[int, Field(ge=1, le=300)]
+MaxSizeMB = Annotated[int, Field(ge=1, le=5000)]
+
+# Argument validators, built once at import instead of on every call
+_URLS_ADAPTER = TypeAdapter(list[str])
+_TIMEOUT_ADAPTER = TypeAdapter(TimeoutSeconds)
+_MAX_SIZE_ADAPTER = TypeAdapter(MaxSizeMB)
+
 
 class DownloadResult(BaseModel):
     """Download result model with file information"""
@@ -110,6 +162,22 @@ class DownloadResponse(BaseModel):
     failed_count: int = Field(..., description="Number of failed downloads")
 
 
+def _validate_limits(timeout: int, max_size_mb: int) -> tuple[int, int]:
+    """Validate timeout and size limit against their declared bounds.
+
+    Args:
+        timeout: Download timeout in seconds
+        max_size_mb: Maximum file size in MB
+
+    Returns:
+        Validated (timeout, max_size_mb)
+
+    Raises:
+        ValueError: If either value is out of range
+    """
+    return _TIMEOUT_ADAPTER.validate_python(timeout), _MAX_SIZE_ADAPTER.validate_python(max_size_mb)
+
+
 def _validate_output_dir(output_dir: str) -> Path:
     """Validate output directory is within allowed paths.
 
@@ -122,34 +190,104 @@ def _validate_output_dir(output_dir: str) -> Path:
     Raises:
         ValueError: If directory is outside allowed locations
     """
-    output_path = Path(output_dir).resolve()
-
-    # Check if within allowed directories
-    for allowed_dir in ALLOWED_BASE_DIRS:
-        try:
-            output_path.relative_to(allowed_dir.resolve())
+    # Lexical check first: collapses ".." without touching the filesystem, so
+    # paths that are plainly outside the allowed locations are rejected cheaply
+    normalized = os.path.normpath(os.path.abspath(os.path.expanduser(output_dir)))
+    if any(
+        normalized == prefix or normalized.startswith(prefix + os.sep)
+        for prefix in _ALLOWED_ROOT_PREFIXES
+    ):
+        # Resolve symlinks so a link inside an allowed directory cannot point outside it
+        output_path = Path(normalized).resolve()
+        if any(output_path.is_relative_to(root) for root in _ALLOWED_ROOTS):
             return output_path
-        except ValueError:
-            continue
 
     allowed_dirs_str = ", ".join(str(d) for d in ALLOWED_BASE_DIRS)
     raise ValueError(f"Output directory must be within allowed locations: {allowed_dirs_str}")
 
 
-def _validate_url_safe(url: str) -> None:
-    """Validate URL is safe from SSRF attacks.
+def _ip_to_int(address: str) -> tuple[int, int] | None:
+    """Convert an IP literal to its version and integer value.
+
+    Args:
+        address: IPv4 or IPv6 address string
+
+    Returns:
+        Tuple of (version, integer value), or None if not an IP literal
+    """
+    try:
+        return 4, int.from_bytes(socket.inet_pton(socket.AF_INET, address), "big")
+    except OSError:
+        pass
+    try:
+        # Drop IPv6 zone index (e.g. "fe80::1%eth0") before packing
+        packed = socket.inet_pton(socket.AF_INET6, address.split("%", 1)[0])
+        return 6, int.from_bytes(packed, "big")
+    except OSError:
+        return None
+
+
+def _is_blocked_ip(address: str) -> bool:
+    """Check whether an IP literal falls into a blocked range.
+
+    Args:
+        address: IPv4 or IPv6 address string
+
+    Returns:
+        True if the address is within BLOCKED_IP_RANGES
+    """
+    converted = _ip_to_int(address)
+    if converted is None:
+        return False
+
+    version, value = converted
+    # Unwrap IPv4-mapped IPv6 addresses (::ffff:a.b.c.d)
+    if version == 6 and value >> 32 == 0xFFFF:
+        version, value = 4, value & 0xFFFFFFFF
+
+    ranges = _IPV4_BLOCKED_RANGES if version == 4 else _IPV6_BLOCKED_RANGES
+    return any(low <= value <= high for low, high in ranges)
+
+
+@lru_cache(maxsize=1024)
+def _resolve_host(hostname: str) -> tuple[str, ...]:
+    """Resolve hostname to its IP addresses.
+
+    Results are cached for the lifetime of the process, so repeated hosts in a
+    batch are resolved once. The cache only keeps answers consistent within a
+    single run; the HTTP client still performs its own lookup when connecting.
+
+    Args:
+        hostname: Lowercase hostname to resolve
+
+    Returns:
+        Tuple of resolved IP address strings
+
+    Raises:
+        socket.gaierror: If the hostname cannot be resolved
+    """
+    return tuple(dict.fromkeys(addr[4][0] for addr in socket.getaddrinfo(hostname, None)))
+
+
+def _validate_url_format(url: str) -> str:
+    """Run the checks on a URL that need no network access.
 
     Args:
         url: URL to validate
 
+    Returns:
+        Hostname of the URL
+
     Raises:
-        ValueError: If URL is unsafe (localhost, private IP, etc.)
+        ValueError: If URL is malformed, too long, non-http(s) or points to localhost
     """
-    # Validate URL length
+    # Cheap checks first, before any parsing work
+    if not url:
+        raise ValueError("Empty URL")
     if len(url) > MAX_URL_LENGTH:
         raise ValueError(f"URL too long (max {MAX_URL_LENGTH} characters)")
 
-    parsed = urllib.parse.urlparse(url)
+    parsed = urllib.parse.urlsplit(url)
 
     # Only allow http/https
     if parsed.scheme not in ("http", "https"):
@@ -164,18 +302,102 @@ def _validate_url_safe(url: str) -> None:
     if hostname.lower() in localhost_names:
         raise ValueError("Access to localhost is not allowed")
 
-    # Resolve hostname to IP and check against blocklist
-    try:
-        addrs = socket.getaddrinfo(hostname, None)
-        for addr in addrs:
-            ip = ipaddress.ip_address(addr[4][0])
-            for blocked_range in BLOCKED_IP_RANGES:
-                if ip in blocked_range:
-                    raise ValueError(
-                        f"Access to {hostname} ({ip}) is blocked (private/internal network)"
-                    )
-    except socket.gaierror as e:
-        raise ValueError(f"Cannot resolve hostname: {hostname}") from e
+    return hostname
+
+
+def _check_host_addresses(hostname: str, addrs: tuple[str, ...]) -> None:
+    """Check resolved addresses of a host against the blocklist.
+
+    Args:
+        hostname: Hostname the addresses belong to (used in the error message)
+        addrs: IP addresses of the host
+
+    Raises:
+        ValueError: If any address is in a blocked range
+    """
+    for ip in addrs:
+        if _is_blocked_ip(ip):
+            raise ValueError(f"Access to {hostname} ({ip}) is blocked (private/internal network)")
+
+
+def _validate_url_safe(url: str) -> None:
+    """Validate URL is safe from SSRF attacks.
+
+    Args:
+        url: URL to validate
+
+    Raises:
+        ValueError: If URL is unsafe (localhost, private IP, etc.)
+    """
+    hostname = _validate_url_format(url)
+
+    # IP literals are checked directly, no DNS lookup needed
+    if _ip_to_int(hostname) is not None:
+        addrs: tuple[str, ...] = (hostname,)
+    else:
+        # Resolve hostname to IP and check against blocklist
+        try:
+            addrs = _resolve_host(hostname.lower())
+        except socket.gaierror as e:
+            raise ValueError(f"Cannot resolve hostname: {hostname}") from e
+
+    _check_host_addresses(hostname, addrs)
+
+
+async def _validate_urls_batch(urls: list[str]) -> list[Exception | None]:
+    """Validate a batch of URLs for SSRF, resolving distinct hostnames concurrently.
+
+    Args:
+        urls: URLs to validate
+
+    Returns:
+        List parallel to urls with the validation error of each URL, or None if it is safe
+    """
+    errors: list[Exception | None] = [None] * len(urls)
+    hostnames: list[str | None] = [None] * len(urls)
+    for i, url in enumerate(urls):
+        try:
+            hostnames[i] = _validate_url_format(url).lower()
+        except ValueError as e:
+            errors[i] = e
+
+    # Resolve each distinct non-literal hostname once, in parallel threads
+    to_resolve = list({h for h in hostnames if h is not None and _ip_to_int(h) is None})
+    resolved = await asyncio.gather(
+        *(asyncio.to_thread(_resolve_host, h) for h in to_resolve), return_exceptions=True
+    )
+    addresses = dict(zip(to_resolve, resolved, strict=True))
+
+    for i, hostname in enumerate(hostnames):
+        if hostname is None:
+            continue
+        addrs = addresses.get(hostname, (hostname,))
+        if isinstance(addrs, socket.gaierror):
+            errors[i] = ValueError(f"Cannot resolve hostname: {hostname}")
+        elif isinstance(addrs, BaseException):
+            errors[i] = addrs
+        else:
+            try:
+                _check_host_addresses(hostname, addrs)
+            except ValueError as e:
+                errors[i] = e
+
+    return errors
+
+
+def _strip_paths(error: Exception) -> str:
+    """Return the error message with filesystem paths removed."""
+    error_str = _UNIX_PATH_RE.sub("[PATH]", str(error))
+    return _WINDOWS_PATH_RE.sub("[PATH]", error_str)
+
+
+# Error type -> user-safe message, checked in order (most frequent first)
+_ERROR_HANDLERS: tuple[tuple[type[Exception], Callable[[Exception], str]], ...] = (
+    (ValueError, _strip_paths),  # Our validation errors are safe
+    (httpx.HTTPStatusError, lambda e: f"HTTP error: {e.response.status_code}"),
+    (httpx.TimeoutException, lambda e: "Download timeout exceeded"),
+    (httpx.ConnectError, lambda e: "Connection failed"),
+)
 
 
 def _sanitize_error(error: Exception) -> str:
@@ -187,24 +409,10 @@ def _sanitize_error(error: Exception) -> str:
     Returns:
         Safe error message for user
     """
-    error_str = str(error)
-
-    # Remove file paths
-    error_str = re.sub(r"/[\w/.-]+", "[PATH]", error_str)
-    error_str = re.sub(r"[A-Z]:\\[\w\\.-]+", "[PATH]", error_str)
-
-    # Map to generic messages for common errors
-    if isinstance(error, httpx.HTTPStatusError):
-        status = error.response.status_code
-        return f"HTTP error: {status}"
-    elif isinstance(error, httpx.TimeoutException):
-        return "Download timeout exceeded"
-    elif isinstance(error, httpx.ConnectError):
-        return "Connection failed"
-    elif isinstance(error, ValueError):
-        return error_str  # Our validation errors are safe
-    else:
-        return "Download failed"
+    for error_type, handler in _ERROR_HANDLERS:
+        if isinstance(error, error_type):
+            return handler(error)
+    return "Download failed"
 
 
 def _sanitize_filename(filename: str) -> str:
@@ -218,7 +426,7 @@ def _sanitize_filename(filename: str) -> str:
     """
     # Remove path separators and other dangerous characters
     # Keep alphanumeric, dots, hyphens, underscores
-    sanitized = re.sub(r'[<>:"/\\|?*\x00-\x1f]', "_", filename)
+    sanitized = filename.translate(_FILENAME_TRANSLATION)
 
     # Remove leading/trailing dots and spaces
     sanitized = sanitized.strip(". ")
@@ -246,20 +454,23 @@ def _extract_filename_from_url(url: str) -> str:
         Extracted and sanitized filename
     """
     try:
-        parsed_url = urllib.parse.urlparse(url)
-        # Get path and remove query parameters
-        path = parsed_url.path
-        filename = Path(path).name
-
-        # Decode URL-encoded characters
-        filename = urllib.parse.unquote(filename)
-
-        if not filename:
+        parsed_url = urllib.parse.urlsplit(url)
+        # Last path segment, skipping empty and "." segments (query and fragment
+        # are already split off), with any ";params" dropped
+        segments = [segment for segment in parsed_url.path.split("/") if segment not in ("", ".")]
+        filename = segments[-1].split(";", 1)[0] if segments else ""
+
+        if filename:
+            # Decode URL-encoded characters
+            filename = urllib.parse.unquote(filename)
+        else:
             # Try to get from query parameters (e.g., ?file=name.pdf)
-            query_params = urllib.parse.parse_qs(parsed_url.query)
+            query_params: dict[str, str] = {}
+            for key, value in urllib.parse.parse_qsl(parsed_url.query):
+                query_params.setdefault(key, value)
             for key in ["file", "filename", "name"]:
                 if key in query_params:
-                    filename = query_params[key][0]
+                    filename = query_params[key]
                     break
 
         if not filename:
@@ -276,7 +487,7 @@ def _extract_filename_from_url(url: str) -> str:
 
 
 def _get_unique_filepath(file_path: Path) -> Path:
-    """Get unique filepath by adding UUID if file exists.
+    """Get unique filepath by adding a random suffix if file exists.
 
     Args:
         file_path: Original file path
@@ -291,18 +502,33 @@ def _get_unique_filepath(file_path: Path) -> Path:
     suffix = file_path.suffix
     parent = file_path.parent
 
-    # Use UUID for guaranteed uniqueness (prevents race conditions)
-    unique_id = uuid.uuid4().hex[:8]
+    # Use a random suffix for uniqueness (prevents race conditions)
+    unique_id = os.urandom(4).hex()
     unique_name = f"{stem}_{unique_id}{suffix}"
     return parent / unique_name
 
 
+def _remove_partial_file(file_path: Path | None) -> None:
+    """Delete a partially downloaded file if it exists (best effort).
+
+    Args:
+        file_path: Path of the file being downloaded, or None if not chosen yet
+    """
+    if file_path and file_path.exists():
+        try:
+            file_path.unlink()
+        except Exception:
+            pass  # Best effort cleanup
+
+
 async def _download_single_file_internal(
     url: str,
     output_dir: str,
     filename: str | None,
     timeout: int,
     max_size_mb: int,
+    url_validated: bool = False,
+    client: httpx.AsyncClient | None = None,
 ) -> DownloadResult:
     """Internal async function to download a single file.
 
@@ -312,6 +538,8 @@ async def _download_single_file_internal(
         filename: Optional custom filename
         timeout: Download timeout in seconds
         max_size_mb: Maximum file size in MB
+        url_validated: Skip SSRF validation if the caller already validated the URL
+        client: Shared HTTP client to use (a new one is created if not provided)
 
     Returns:
         DownloadResult with download information
@@ -319,7 +547,8 @@ async def _download_single_file_internal(
     file_path = None
     try:
         # Validate URL for SSRF
-        _validate_url_safe(url)
+        if not url_validated:
+            _validate_url_safe(url)
 
         # Validate and resolve output directory
         output_path = _validate_output_dir(output_dir)
@@ -350,75 +579,67 @@ async def _download_single_file_internal(
             "Connection": "keep-alive",
         }
 
-        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-            # First, do a HEAD request to check size
-            try:
-                head_response = await client.head(url, headers=headers)
-                content_length = head_response.headers.get("Content-Length")
+        async with contextlib.AsyncExitStack() as stack:
+            # Reuse the caller's client if given, otherwise open one for this download
+            if client is None:
+                client = await stack.enter_async_context(
+                    httpx.AsyncClient(timeout=timeout, follow_redirects=True)
+                )
+
+            # Download the file (no separate HEAD request, the GET headers carry the size)
+            response = await stack.enter_async_context(client.stream("GET", url, headers=headers))
+            response.raise_for_status()
+
+            # Reject oversized files from the headers, before reading any of the body
+            content_length = response.headers.get("Content-Length")
+            if content_length:
+                size = int(content_length)
+                if size > max_size_bytes:
+                    size_mb = size / (1024 * 1024)
+                    raise ValueError(
+                        f"File size ({size_mb:.2f} MB) exceeds "
+                        f"maximum allowed size ({max_size_mb} MB)"
+                    )
+
+            content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+            downloaded = 0
+
+            # Validate MIME type if present
+            if content_type and content_type not in ALLOWED_CONTENT_TYPES:
+                raise ValueError(f"File type not allowed: {content_type}")
 
-                if content_length:
-                    size = int(content_length)
-                    if size > max_size_bytes:
-                        size_mb = size / (1024 * 1024)
+            # Stream to file chunk by chunk, never holding the whole body in memory
+            with open(file_path, "wb") as f:
+                async for chunk in response.aiter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    downloaded += len(chunk)
+
+                    # Check size during download (partial file is removed below)
+                    if downloaded > max_size_bytes:
+                        size_mb = downloaded / (1024 * 1024)
                         raise ValueError(
-                            f"File size ({size_mb:.2f} MB) exceeds "
-                            f"maximum allowed size ({max_size_mb} MB)"
+                            f"File exceeded size limit during download "
+                            f"({size_mb:.2f} MB > {max_size_mb} MB)"
                         )
-            except httpx.HTTPStatusError:
-                # HEAD request not supported, continue with GET
-                pass
-
-            # Download the file
-            async with client.stream("GET", url, headers=headers) as response:
-                response.raise_for_status()
-
-                content_type = response.headers.get("Content-Type", "").split(";")[0]
-                downloaded = 0
-
-                # Validate MIME type if present
-                if content_type and content_type not in ALLOWED_CONTENT_TYPES:
-                    raise ValueError(f"File type not allowed: {content_type}")
-
-                # Write to file
-                with open(file_path, "wb") as f:
-                    async for chunk in response.aiter_bytes(chunk_size=8192):
-                        downloaded += len(chunk)
-
-                        # Check size during download
-                        if downloaded > max_size_bytes:
-                            # Delete partial file
-                            if file_path.exists():
-                                file_path.unlink()
-                            size_mb = downloaded / (1024 * 1024)
-                            raise ValueError(
-                                f"File exceeded size limit during download "
-                                f"({size_mb:.2f} MB > {max_size_mb} MB)"
-                            )
-
-                        f.write(chunk)
-
-                # Verify file was created
-                if not file_path.exists():
-                    raise ValueError("File was not created")
-
-                actual_size = file_path.stat().st_size
-
-                return DownloadResult(
-                    file_path=str(file_path),
-                    file_name=final_filename,
-                    file_size=actual_size,
-                    content_type=content_type,
-                    success=True,
-                    error=None,
-                )
+
+                    f.write(chunk)
+
+            # Verify file was created
+            if not file_path.exists():
+                raise ValueError("File was not created")
+
+            actual_size = file_path.stat().st_size
+
+            return DownloadResult(
+                file_path=str(file_path),
+                file_name=final_filename,
+                file_size=actual_size,
+                content_type=content_type,
+                success=True,
+                error=None,
+            )
 
     except Exception as e:
-        # Clean up partial file if exists
-        if file_path and file_path.exists():
-            try:
-                file_path.unlink()
-            except Exception:
-                pass  # Best effort cleanup
+        _remove_partial_file(file_path)
 
         return DownloadResult(
             file_path="",
@@ -428,6 +649,10 @@ async def _download_single_file_internal(
             success=False,
             error=_sanitize_error(e),
         )
+    except BaseException:
+        # Cancellation must not leave a partial file behind either
+        _remove_partial_file(file_path)
+        raise
 
 
 @mcp.tool(description="Download multiple files from URLs and save to local filesystem.")
@@ -436,10 +661,11 @@ async def download_files(
     output_dir: Annotated[
         str | None, Field(description="Directory to save downloaded files")
     ] = None,
-    timeout: Annotated[int, Field(description="Download timeout in seconds", ge=1, le=300)] = 60,
+    timeout: Annotated[TimeoutSeconds, Field(description="Download timeout in seconds")] = 60,
     max_size_mb: Annotated[
-        int, Field(description="Maximum file size in MB (default: 500)", ge=1, le=5000)
+        MaxSizeMB, Field(description="Maximum file size in MB (default: 500)")
     ] = MAX_FILE_SIZE_MB,
+    ctx: Context | None = None,
 ) -> DownloadResponse:
     """Download files from URLs and save to the local filesystem.
 
@@ -448,6 +674,7 @@ async def download_files(
         output_dir: Directory to save the files (defaults to ~/Downloads/mcp_downloads)
         timeout: Download timeout in seconds (1-300)
         max_size_mb: Maximum file size in MB (1-5000)
+        ctx: MCP request context, used to report progress as each download finishes
 
     Returns:
         DownloadResponse with results for each file
@@ -455,20 +682,61 @@ async def download_files(
     if output_dir is None:
         output_dir = str(DEFAULT_DOWNLOAD_DIR)
 
+    # Enforce the declared argument types and bounds for direct (non-MCP) callers too
+    urls = _URLS_ADAPTER.validate_python(urls)
+    timeout, max_size_mb = _validate_limits(timeout, max_size_mb)
+
     # Limit number of URLs per request
     if len(urls) > MAX_URLS_PER_REQUEST:
         raise ValueError(f"Maximum {MAX_URLS_PER_REQUEST} URLs per request")
 
+    # Validate all URLs up front so hostname lookups run concurrently
+    url_errors = await _validate_urls_batch(urls)
+
     # Use semaphore to limit concurrent downloads
     semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
 
-    async def download_with_limit(url: str) -> DownloadResult:
+    async def download_with_limit(
+        client: httpx.AsyncClient, url: str, url_error: Exception | None
+    ) -> DownloadResult:
+        if url_error is not None:
+            return DownloadResult(
+                file_path="",
+                file_name="",
+                file_size=0,
+                content_type=None,
+                success=False,
+                error=_sanitize_error(url_error),
+            )
         async with semaphore:
-            return await _download_single_file_internal(url, output_dir, None, timeout, max_size_mb)
-
-    # Download all files with concurrency limit
-    tasks = [download_with_limit(url) for url in urls]
-    results = await asyncio.gather(*tasks, return_exceptions=False)
+            return await _download_single_file_internal(
+                url, output_dir, None, timeout, max_size_mb, url_validated=True, client=client
+            )
+
+    # Share one client (and its connection pool) across all downloads
+    limits = httpx.Limits(
+        max_connections=MAX_CONCURRENT_DOWNLOADS,
+        max_keepalive_connections=MAX_CONCURRENT_DOWNLOADS,
+    )
+    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True, limits=limits) as client:
+        # Download all files with concurrency limit (failures are returned as results)
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(download_with_limit(client, url, url_error))
+                for url, url_error in zip(urls, url_errors, strict=True)
+            ]
+            # Report progress as downloads finish rather than only once the slowest is done
+            for done, next_finished in enumerate(asyncio.as_completed(tasks), start=1):
+                await next_finished
+                if ctx is not None:
+                    # Progress is best effort; a failed notification must not cancel downloads
+                    try:
+                        await ctx.report_progress(done, len(tasks))
+                    except Exception:
+                        pass
+
+        # Results keep the order of the input URLs
+        results = [task.result() for task in tasks]
 
     success_count = sum(1 for r in results if r.success)
     failed_count = len(results) - success_count
@@ -481,9 +749,9 @@ async def download_single_file(
     url: Annotated[str, Field(description="URL of the file to download")],
     output_dir: Annotated[str | None, Field(description="Directory to save the file")] = None,
     filename: Annotated[str | None, Field(description="Custom filename (optional)")] = None,
-    timeout: Annotated[int, Field(description="Download timeout in seconds", ge=1, le=300)] = 60,
+    timeout: Annotated[TimeoutSeconds, Field(description="Download timeout in seconds")] = 60,
     max_size_mb: Annotated[
-        int, Field(description="Maximum file size in MB (default: 500)", ge=1, le=5000)
+        MaxSizeMB, Field(description="Maximum file size in MB (default: 500)")
     ] = MAX_FILE_SIZE_MB,
 ) -> DownloadResult:
     """Download a single file from URL and save to the local filesystem.
@@ -501,6 +769,9 @@ async def download_single_file(
     if output_dir is None:
         output_dir = str(DEFAULT_DOWNLOAD_DIR)
 
+    # Enforce the declared bounds for direct (non-MCP) callers too
+    timeout, max_size_mb = _validate_limits(timeout, max_size_mb)
+
     return await _download_single_file_internal(url, output_dir, filename, timeout, max_size_mb)
 
 
@@ -1,28 +1,77 @@
 """Pytest configuration and fixtures for MCP URL Downloader tests."""
 
-import tempfile
+import re
 from pathlib import Path
+from types import MappingProxyType
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test downloads."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+@pytest.fixture(scope="session")
+def _session_tmp(tmp_path_factory):
+    """Shared base directory for test downloads, cleaned up by pytest."""
+    return tmp_path_factory.mktemp("mcp_url_tests")
 
 
 @pytest.fixture
+def temp_dir(_session_tmp, request) -> Path:
+    """Create a per-test subdirectory of the session temp dir for test downloads."""
+    path = _session_tmp / re.sub(r"\W", "_", request.node.nodeid)
+    path.mkdir(exist_ok=True)
+    return path
+
+
+@pytest.fixture(scope="session")
 def sample_file_content():
     """Sample file content for testing."""
     return b"This is a test file content. " * 100
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_response_headers():
-    """Mock HTTP response headers."""
-    return {
-        "Content-Type": "application/pdf",
-        "Content-Length": "1024",
-    }
+    """Mock HTTP response headers (read-only, shared across tests)."""
+    return MappingProxyType(
+        {
+            "Content-Type": "application/pdf",
+            "Content-Length": "1024",
+        }
+    )
+
+
+@pytest.fixture
+def httpx_mock_factory(monkeypatch):
+    """Patch the server's network access with a mock HTTP client.
+
+    Hostname resolution is stubbed to a public address and httpx.AsyncClient is
+    replaced by a mock whose streamed GET response has the given headers and
+    yields the given body chunks. The factory returns the mock client instance.
+    """
+
+    def _make(headers, chunks=()):
+        async def aiter_bytes(chunk_size=None):
+            for chunk in chunks:
+                yield chunk
+
+        response = Mock(headers=headers, aiter_bytes=aiter_bytes)
+
+        stream_cm = AsyncMock()
+        stream_cm.__aenter__.return_value = response
+        stream_cm.__aexit__.return_value = None
+
+        client_instance = AsyncMock()
+        client_instance.stream = Mock(return_value=stream_cm)
+
+        client_cm = AsyncMock()
+        client_cm.__aenter__.return_value = client_instance
+        client_cm.__aexit__.return_value = None
+
+        monkeypatch.setattr(
+            "mcp_url_downloader.server._resolve_host", lambda hostname: ("93.184.216.34",)
+        )
+        monkeypatch.setattr(
+            "mcp_url_downloader.server.httpx.AsyncClient", Mock(return_value=client_cm)
+        )
+        return client_instance
+
+    return _make
@@ -1,6 +1,7 @@
 """Tests for download functionality in the MCP URL Downloader."""
 
-from unittest.mock import AsyncMock, Mock, patch
+import asyncio
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -14,7 +15,6 @@ from mcp_url_downloader.server import (
 class TestDownloadSingleFileInternal:
     """Tests for _download_single_file_internal function."""
 
-    @pytest.mark.asyncio
     async def test_download_invalid_url(self, temp_dir):
         """Test download with invalid URL."""
         result = await _download_single_file_internal(
@@ -29,67 +29,127 @@ class TestDownloadSingleFileInternal:
         assert result.error is not None
         assert "Invalid URL format" in result.error
 
-    @pytest.mark.asyncio
-    async def test_download_file_too_large_from_header(self, temp_dir):
+    async def test_download_file_too_large_from_header(self, temp_dir, httpx_mock_factory):
         """Test download fails when file exceeds size limit based on Content-Length header."""
         url = "https://example.com/large.pdf"
 
-        mock_head_response = Mock()
         # 600MB file, but limit is 500MB
-        mock_head_response.headers = {"Content-Length": str(600 * 1024 * 1024)}
+        httpx_mock_factory({"Content-Length": str(600 * 1024 * 1024)})
 
-        with patch("mcp_url_downloader.server.httpx.AsyncClient") as mock_client:
-            mock_client_instance = AsyncMock()
-            mock_client_instance.head = AsyncMock(return_value=mock_head_response)
-
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
-            mock_client.return_value.__aexit__.return_value = None
-
-            result = await _download_single_file_internal(
-                url=url,
-                output_dir=str(temp_dir),
-                filename=None,
-                timeout=60,
-                max_size_mb=500,
-            )
+        result = await _download_single_file_internal(
+            url=url,
+            output_dir=str(temp_dir),
+            filename=None,
+            timeout=60,
+            max_size_mb=500,
+        )
 
-            assert result.success is False
-            assert result.error is not None
-            assert "exceeds maximum allowed size" in result.error
+        assert result.success is False
+        assert result.error is not None
+        assert "exceeds maximum allowed size" in result.error
 
-    @pytest.mark.asyncio
-    async def test_download_custom_filename(self, temp_dir):
+    async def test_download_custom_filename(self, temp_dir, httpx_mock_factory):
         """Test that custom filename is used when provided."""
         url = "https://example.com/file.pdf"
         custom_filename = "my_custom_name.pdf"
 
         # Simulate file too large to avoid actual download
-        mock_head_response = Mock()
-        mock_head_response.headers = {"Content-Length": str(600 * 1024 * 1024)}
+        httpx_mock_factory({"Content-Length": str(600 * 1024 * 1024)})
+
+        result = await _download_single_file_internal(
+            url=url,
+            output_dir=str(temp_dir),
+            filename=custom_filename,
+            timeout=60,
+            max_size_mb=500,
+        )
+
+        # Even though download failed, the filename should be set correctly
+        assert result.file_name == custom_filename
+
+    async def test_download_writes_streamed_body(self, temp_dir, httpx_mock_factory):
+        """Test that the streamed response body is written to the output file."""
+        client = httpx_mock_factory({"Content-Type": "text/plain"}, chunks=[b"hello ", b"world"])
+
+        result = await _download_single_file_internal(
+            url="https://example.com/hello.txt",
+            output_dir=str(temp_dir),
+            filename=None,
+            timeout=60,
+            max_size_mb=500,
+        )
+
+        assert result.success is True
+        assert result.file_size == 11
+        assert (temp_dir / "hello.txt").read_bytes() == b"hello world"
+        client.head.assert_not_called()
+
+    async def test_download_content_type_case_insensitive(self, temp_dir, httpx_mock_factory):
+        """Test that the Content-Type header is normalized before the allowlist check."""
+        httpx_mock_factory({"Content-Type": "Application/PDF; charset=binary"}, chunks=[b"%PDF"])
 
-        with patch("mcp_url_downloader.server.httpx.AsyncClient") as mock_client:
-            mock_client_instance = AsyncMock()
-            mock_client_instance.head = AsyncMock(return_value=mock_head_response)
+        result = await _download_single_file_internal(
+            url="https://example.com/doc.pdf",
+            output_dir=str(temp_dir),
+            filename=None,
+            timeout=60,
+            max_size_mb=500,
+        )
+
+        assert result.success is True
+        assert result.content_type == "application/pdf"
+
+    async def test_download_cancelled_removes_partial_file(self, temp_dir, httpx_mock_factory):
+        """Test that cancelling a download mid-stream removes the partial file."""
+        client = httpx_mock_factory({"Content-Type": "text/plain"})
+        first_chunk_written = asyncio.Event()
 
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
-            mock_client.return_value.__aexit__.return_value = None
+        async def stalled_body(chunk_size=None):
+            yield b"partial"
+            first_chunk_written.set()
+            await asyncio.Event().wait()
 
-            result = await _download_single_file_internal(
-                url=url,
+        response = client.stream.return_value.__aenter__.return_value
+        response.aiter_bytes = stalled_body
+
+        task = asyncio.create_task(
+            _download_single_file_internal(
+                url="https://example.com/slow.txt",
                 output_dir=str(temp_dir),
-                filename=custom_filename,
+                filename=None,
                 timeout=60,
                 max_size_mb=500,
             )
+        )
+        await first_chunk_written.wait()
+        assert (temp_dir / "slow.txt").exists()
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert not (temp_dir / "slow.txt").exists()
+
+    async def test_download_file_too_large_while_streaming(self, temp_dir, httpx_mock_factory):
+        """Test that a body exceeding the limit without Content-Length is rejected."""
+        chunk = b"x" * (600 * 1024)
+        httpx_mock_factory({"Content-Type": "application/pdf"}, chunks=[chunk, chunk])
+
+        result = await _download_single_file_internal(
+            url="https://example.com/big.pdf",
+            output_dir=str(temp_dir),
+            filename=None,
+            timeout=60,
+            max_size_mb=1,
+        )
 
-            # Even though download failed, the filename should be set correctly
-            assert result.file_name == custom_filename
+        assert result.success is False
+        assert "exceeded size limit" in result.error
+        assert not (temp_dir / "big.pdf").exists()
 
 
 class TestDownloadFiles:
     """Tests for download_files function."""
 
-    @pytest.mark.asyncio
     async def test_download_files_empty_list(self, temp_dir):
         """Test downloading with empty URL list."""
         result = await download_files(urls=[], output_dir=str(temp_dir))
@@ -98,7 +158,20 @@ class TestDownloadFiles:
         assert result.failed_count == 0
         assert len(result.results) == 0
 
-    @pytest.mark.asyncio
+    async def test_download_files_shares_client(self, temp_dir, httpx_mock_factory):
+        """Test that all downloads in a batch go through one shared HTTP client."""
+        import mcp_url_downloader.server as server
+
+        client = httpx_mock_factory({"Content-Type": "text/plain"}, chunks=[b"data"])
+        urls = [f"https://example.com/file{i}.txt" for i in range(3)]
+
+        result = await download_files(urls=urls, output_dir=str(temp_dir))
+
+        assert result.success_count == 3
+        server.httpx.AsyncClient.assert_called_once()
+        assert client.stream.call_count == len(urls)
+        assert sorted(call.args[1] for call in client.stream.call_args_list) == urls
+
     async def test_download_files_with_invalid_urls(self, temp_dir):
         """Test downloading with invalid URLs."""
         urls = [
@@ -117,11 +190,39 @@ class TestDownloadFiles:
             assert res.success is False
             assert "Invalid URL format" in res.error
 
+    async def test_download_files_reports_progress(self, temp_dir):
+        """Test that progress is reported once per finished download."""
+        ctx = Mock()
+        ctx.report_progress = AsyncMock()
+        urls = ["ftp://example.com/a.txt", "http://10.0.0.1/b.txt", "file:///etc/passwd"]
+
+        result = await download_files(urls=urls, output_dir=str(temp_dir), ctx=ctx)
+
+        assert [call.args for call in ctx.report_progress.await_args_list] == [
+            (1, 3),
+            (2, 3),
+            (3, 3),
+        ]
+        assert "protocol" in result.results[0].error.lower()
+        assert "blocked" in result.results[1].error.lower()
+
+    async def test_download_files_progress_failure_ignored(self, temp_dir, httpx_mock_factory):
+        """Test that a failing progress notification does not abort the batch."""
+        httpx_mock_factory({"Content-Type": "text/plain"}, chunks=[b"data"])
+        ctx = Mock()
+        ctx.report_progress = AsyncMock(side_effect=RuntimeError("client disconnected"))
+        urls = [f"https://example.com/report{i}.txt" for i in range(3)]
+
+        result = await download_files(urls=urls, output_dir=str(temp_dir), ctx=ctx)
+
+        assert result.success_count == 3
+        assert ctx.report_progress.await_count == 3
+        assert sorted(p.name for p in temp_dir.iterdir()) == [f"report{i}.txt" for i in range(3)]
+
 
 class TestDownloadSingleFile:
     """Tests for download_single_file function."""
 
-    @pytest.mark.asyncio
     async def test_download_single_file_invalid_url(self):
         """Test download_single_file with invalid URL."""
         result = await download_single_file(url="invalid-url")
@@ -6,6 +6,7 @@ from mcp_url_downloader.server import (
     _sanitize_error,
     _validate_output_dir,
     _validate_url_safe,
+    _validate_urls_batch,
     download_files,
     download_single_file,
 )
@@ -14,56 +15,48 @@ from mcp_url_downloader.server import (
 class TestSSRFProtection:
     """Tests for Server-Side Request Forgery protection."""
 
-    @pytest.mark.asyncio
     async def test_localhost_blocked(self):
         """Test that localhost URLs are blocked."""
         result = await download_single_file("http://localhost/test.txt")
         assert not result.success
         assert "localhost" in result.error.lower()
 
-    @pytest.mark.asyncio
     async def test_localhost_ip_blocked(self):
         """Test that 127.0.0.1 is blocked."""
         result = await download_single_file("http://127.0.0.1/test.txt")
         assert not result.success
         assert "not allowed" in result.error.lower()
 
-    @pytest.mark.asyncio
     async def test_private_ip_10_blocked(self):
         """Test that private IP 10.x.x.x is blocked."""
         result = await download_single_file("http://10.0.0.1/test.txt")
         assert not result.success
         assert "blocked" in result.error.lower() or "private" in result.error.lower()
 
-    @pytest.mark.asyncio
     async def test_private_ip_192_blocked(self):
         """Test that private IP 192.168.x.x is blocked."""
         result = await download_single_file("http://192.168.1.1/test.txt")
         assert not result.success
         assert "blocked" in result.error.lower() or "private" in result.error.lower()
 
-    @pytest.mark.asyncio
     async def test_private_ip_172_blocked(self):
         """Test that private IP 172.16.x.x is blocked."""
         result = await download_single_file("http://172.16.0.1/test.txt")
         assert not result.success
         assert "blocked" in result.error.lower() or "private" in result.error.lower()
 
-    @pytest.mark.asyncio
     async def test_link_local_blocked(self):
         """Test that link-local IP 169.254.x.x is blocked (AWS metadata)."""
         result = await download_single_file("http://169.254.169.254/latest/meta-data/")
         assert not result.success
         assert "blocked" in result.error.lower() or "private" in result.error.lower()
 
-    @pytest.mark.asyncio
     async def test_file_protocol_blocked(self):
         """Test that file:// protocol is blocked."""
         result = await download_single_file("file:///etc/passwd")
         assert not result.success
         assert "protocol" in result.error.lower() or "unsupported" in result.error.lower()
 
-    @pytest.mark.asyncio
     async def test_ftp_protocol_blocked(self):
         """Test that ftp:// protocol is blocked."""
         result = await download_single_file("ftp://example.com/file.txt")
@@ -80,17 +73,65 @@ class TestSSRFProtection:
         with pytest.raises(ValueError, match="blocked"):
             _validate_url_safe("http://192.168.1.1/")
 
+    def test_validate_url_safe_cgnat_ip(self):
+        """Test _validate_url_safe blocks carrier-grade NAT addresses."""
+        with pytest.raises(ValueError, match="blocked"):
+            _validate_url_safe("http://100.64.0.1/")
+
+    def test_validate_url_safe_ipv4_mapped_ipv6(self):
+        """Test _validate_url_safe blocks IPv4-mapped IPv6 loopback."""
+        with pytest.raises(ValueError, match="blocked"):
+            _validate_url_safe("http://[::ffff:127.0.0.1]/")
+
+    def test_validate_url_safe_ip_literal_skips_dns(self):
+        """Test _validate_url_safe does not resolve IP literal hosts."""
+        from unittest.mock import patch
+
+        with patch("mcp_url_downloader.server._resolve_host") as mock_resolve:
+            _validate_url_safe("http://93.184.216.34/file.txt")
+            mock_resolve.assert_not_called()
+
     def test_validate_url_safe_too_long(self):
         """Test _validate_url_safe blocks overly long URLs."""
         long_url = "http://example.com/" + "a" * 3000
         with pytest.raises(ValueError, match="too long"):
             _validate_url_safe(long_url)
 
+    def test_validate_url_safe_empty(self):
+        """Test _validate_url_safe rejects an empty URL."""
+        with pytest.raises(ValueError, match="Empty URL"):
+            _validate_url_safe("")
+
     def test_validate_url_safe_invalid_scheme(self):
         """Test _validate_url_safe blocks non-http(s) schemes."""
         with pytest.raises(ValueError, match="protocol"):
             _validate_url_safe("javascript:alert(1)")
 
+    async def test_validate_urls_batch(self):
+        """Test _validate_urls_batch reports per-URL errors in input order."""
+        errors = await _validate_urls_batch(
+            ["http://10.0.0.1/", "ftp://example.com/", "http://93.184.216.34/a.txt"]
+        )
+        assert isinstance(errors[0], ValueError)
+        assert "blocked" in str(errors[0])
+        assert isinstance(errors[1], ValueError)
+        assert "protocol" in str(errors[1])
+        assert errors[2] is None
+
+    async def test_validate_urls_batch_resolves_each_host_once(self):
+        """Test _validate_urls_batch looks up duplicate hostnames only once."""
+        from unittest.mock import patch
+
+        with patch(
+            "mcp_url_downloader.server._resolve_host", return_value=("93.184.216.34",)
+        ) as mock_resolve:
+            errors = await _validate_urls_batch(
+                ["https://example.com/a.pdf", "https://EXAMPLE.com/b.pdf"]
+            )
+
+        assert errors == [None, None]
+        mock_resolve.assert_called_once_with("example.com")
+
 
 class TestPathTraversal:
     """Tests for path traversal protection."""
@@ -103,7 +144,16 @@ class TestPathTraversal:
     def test_path_traversal_parent_blocked(self, temp_dir):
         """Test that .. traversal is blocked."""
         with pytest.raises(ValueError, match="allowed locations"):
-            _validate_output_dir(str(temp_dir / ".." / ".." / "etc"))
+            # Climb past the filesystem root regardless of how deep temp_dir is
+            escape = [".."] * len(temp_dir.parts)
+            _validate_output_dir(str(temp_dir.joinpath(*escape, "etc")))
+
+    def test_path_traversal_symlink_blocked(self, temp_dir):
+        """Test that a symlink inside an allowed dir pointing outside is blocked."""
+        link = temp_dir / "escape"
+        link.symlink_to("/etc", target_is_directory=True)
+        with pytest.raises(ValueError, match="allowed locations"):
+            _validate_output_dir(str(link))
 
     def test_path_traversal_root_blocked(self):
         """Test that writing to root is blocked."""
@@ -126,7 +176,6 @@ class TestPathTraversal:
         result = _validate_output_dir(str(documents))
         assert result.is_absolute()
 
-    @pytest.mark.asyncio
     async def test_download_to_forbidden_path(self):
         """Test that download to forbidden path fails."""
         result = await download_single_file(url="https://example.com/test.txt", output_dir="/etc")
@@ -137,7 +186,6 @@ class TestPathTraversal:
 class TestDoSProtection:
     """Tests for Denial of Service protection."""
 
-    @pytest.mark.asyncio
     async def test_concurrent_download_limit(self):
         """Test that concurrent downloads are limited."""
         # Create list of many URLs
@@ -151,7 +199,6 @@ class TestDoSProtection:
         assert len(result.results) == 20
         assert result.failed_count == 20
 
-    @pytest.mark.asyncio
     async def test_max_urls_limit(self):
         """Test that too many URLs are rejected."""
         urls = [f"https://example.com/file{i}.txt" for i in range(150)]
@@ -159,7 +206,27 @@ class TestDoSProtection:
         with pytest.raises(ValueError, match="Maximum.*URLs"):
             await download_files(urls)
 
-    @pytest.mark.asyncio
+    async def test_timeout_out_of_range_rejected(self):
+        """Test that download_files rejects out-of-range timeout and size values."""
+        with pytest.raises(ValueError):
+            await download_files([], timeout=0)
+        with pytest.raises(ValueError):
+            await download_files([], max_size_mb=10_000)
+
+    async def test_urls_not_a_list_rejected(self):
+        """Test that a non-list urls argument raises a validation error, not TypeError."""
+        from pydantic import ValidationError
+
+        with pytest.raises(ValidationError):
+            await download_files(None)
+
+    async def test_single_file_limits_out_of_range_rejected(self):
+        """Test that download_single_file rejects out-of-range timeout and size values."""
+        with pytest.raises(ValueError):
+            await download_single_file("https://example.com/test.txt", timeout=0)
+        with pytest.raises(ValueError):
+            await download_single_file("https://example.com/test.txt", max_size_mb=0)
+
     async def test_timeout_validation(self):
         """Test that invalid timeout values are rejected."""
         # Pydantic should validate these via Field constraints
@@ -219,13 +286,11 @@ class TestErrorSanitization:
 class TestInputValidation:
     """Tests for input validation."""
 
-    @pytest.mark.asyncio
     async def test_empty_url(self):
         """Test that empty URL is rejected."""
         result = await download_single_file("")
         assert not result.success
 
-    @pytest.mark.asyncio
     async def test_invalid_url_format(self):
         """Test that invalid URL format is rejected."""
         result = await download_single_file("not a url")
@@ -236,7 +301,6 @@ class TestInputValidation:
             or "protocol" in result.error.lower()
         )
 
-    @pytest.mark.asyncio
     async def test_url_without_scheme(self):
         """Test that URL without scheme is rejected."""
         result = await download_single_file("example.com/file.txt")
@@ -246,7 +310,6 @@ class TestInputValidation:
 class TestMIMETypeValidation:
     """Tests for MIME type validation."""
 
-    @pytest.mark.asyncio
     async def test_allowed_mime_types(self):
         """Test that common safe MIME types would be allowed."""
         # This is a unit test - we can't actually download
@@ -257,7 +320,6 @@ class TestMIMETypeValidation:
         assert "image/jpeg" in ALLOWED_CONTENT_TYPES
         assert "text/plain" in ALLOWED_CONTENT_TYPES
 
-    @pytest.mark.asyncio
     async def test_executable_mime_blocked(self):
         """Test that executable MIME types are not in allowed list."""
         from mcp_url_downloader.server import ALLOWED_CONTENT_TYPES
@@ -116,6 +116,18 @@ class TestExtractFilenameFromUrl:
         result = _extract_filename_from_url(url)
         assert result == "document.pdf"
 
+    def test_extract_filename_drops_path_params(self):
+        """Test that ;params on the last path segment are not part of the filename."""
+        url = "https://example.com/file.pdf;v=1"
+        result = _extract_filename_from_url(url)
+        assert result == "file.pdf"
+
+    def test_extract_filename_dot_segment(self):
+        """Test that a trailing "." segment falls back to the parent segment."""
+        url = "https://example.com/a/."
+        result = _extract_filename_from_url(url)
+        assert result == "a.bin"
+
     def test_extract_filename_special_chars(self):
         """Test extraction of filename with special characters."""
         url = "https://example.com/file%3Aname.pdf"
@@ -139,7 +151,7 @@ class TestGetUniqueFilepath:
         file_path.touch()  # Create the file
 
         result = _get_unique_filepath(file_path)
-        # Should create unique name with UUID, not test.txt
+        # Should create unique name with random suffix, not test.txt
         assert result != file_path
         assert result.suffix == ".txt"
         assert result.parent == temp_dir
@@ -153,7 +165,7 @@ class TestGetUniqueFilepath:
         (temp_dir / "test_2.txt").touch()
 
         result = _get_unique_filepath(file_path)
-        # Should always create unique name with UUID
+        # Should always create unique name with random suffix
         assert result != file_path
         assert result.suffix == ".txt"
         assert not result.exists()